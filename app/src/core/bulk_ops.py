@@ -114,7 +114,7 @@ async def _bulk_upsert_categories_impl(
             }
         )
 
-    debug_logger.debug(f"Executing bulk upsert for {len(values)} category values")
+    debug_logger.debug("Executing bulk upsert for %d category values", len(values))
     stmt = insert(Category).values(values)
     stmt = stmt.on_conflict_do_update(
         index_elements=["id"],
@@ -125,7 +125,7 @@ async def _bulk_upsert_categories_impl(
 
     result = await session.execute(stmt)
     rowcount = result.rowcount
-    debug_logger.debug(f"Categories bulk upsert completed, affected rows: {rowcount}")
+    debug_logger.debug("Categories bulk upsert completed, affected rows: %s", rowcount)
     return rowcount
 
 
@@ -152,7 +152,10 @@ async def bulk_upsert_categories(
         return 0
 
     debug_logger.debug(
-        f"bulk_upsert_categories called with {len(categories)} categories, platform: {platform}, skip_on_contention: {skip_on_contention}"
+        "bulk_upsert_categories called with %d categories, platform: %s, skip_on_contention: %s",
+        len(categories),
+        platform,
+        skip_on_contention,
     )
 
     if skip_on_contention:
@@ -163,16 +166,17 @@ async def bulk_upsert_categories(
         try:
             result = await _bulk_upsert_categories_impl(session, categories, platform)
             debug_logger.debug(
-                f"Categories upsert completed without contention, result: {result}"
+                "Categories upsert completed without contention, result: %s", result
             )
             return result
         except DBAPIError as e:
             debug_logger.debug(
-                f"DBAPIError in skip_on_contention mode: {type(e).__name__}: {str(e)}"
+                "DBAPIError in skip_on_contention mode: %s: %s", type(e).__name__, e
             )
             if "deadlock" in str(e).lower() or "lock" in str(e).lower():
                 logger.debug(
-                    f"Skipping {len(categories)} categories due to lock contention (skip_on_contention=True)"
+                    "Skipping %d categories due to lock contention (skip_on_contention=True)",
+                    len(categories),
                 )
                 debug_logger.debug(
                     "Lock contention detected, skipping categories as requested"
@@ -187,7 +191,7 @@ async def bulk_upsert_categories(
             _bulk_upsert_categories_impl, session, categories, platform
         )
         debug_logger.debug(
-            f"Categories upsert completed with retry logic, result: {result}"
+            "Categories upsert completed with retry logic, result: %s", result
         )
         return result
 
@@ -210,7 +214,9 @@ async def bulk_upsert_products(
         Number of rows affected
     """
     debug_logger.debug(
-        f"Starting bulk_upsert_products with {len(products)} products, platform: {platform}"
+        "Starting bulk_upsert_products with %d products, platform: %s",
+        len(products),
+        platform,
     )
     if not products:
         debug_logger.debug("No products provided, returning 0")
@@ -218,16 +224,19 @@ async def bulk_upsert_products(
 
     # Deduplicate by ID (keep last occurrence to avoid CardinalityViolationError)
     original_count = len(products)
-    debug_logger.debug(f"Deduplicating {original_count} products by ID")
+    debug_logger.debug("Deduplicating %d products by ID", original_count)
     seen_ids = {}
     for p in products:
         seen_ids[p["id"]] = p
     products = list(seen_ids.values())
     debug_logger.debug(
-        f"After deduplication: {len(products)} unique products (removed {original_count - len(products)} duplicates)"
+        "After deduplication: %d unique products (removed %d duplicates)",
+        len(products),
+        original_count - len(products),
     )
 
     # Prepare data
+    now = datetime.utcnow()  # One timestamp for the whole batch
     values = []
     for p in products:
         values.append(
@@ -257,12 +266,12 @@ async def bulk_upsert_products(
                 "has_warranty": p.get("has_warranty", False),
                 "warranty_info": p.get("warranty_info"),
                 "raw_data": p.get("raw_data"),
-                "last_seen_at": datetime.utcnow(),
-                "updated_at": datetime.utcnow(),
+                "last_seen_at": now,
+                "updated_at": now,
             }
         )
 
-    debug_logger.debug(f"Prepared {len(values)} product values for bulk upsert")
+    debug_logger.debug("Prepared %d product values for bulk upsert", len(values))
     stmt = insert(Product).values(values)
     stmt = stmt.on_conflict_do_update(
         index_elements=["id"],
@@ -296,7 +305,7 @@ async def bulk_upsert_products(
     debug_logger.debug("Executing products bulk upsert statement")
     result = await session.execute(stmt)
     rowcount = result.rowcount
-    debug_logger.debug(f"Products bulk upsert completed, affected rows: {rowcount}")
+    debug_logger.debug("Products bulk upsert completed, affected rows: %s", rowcount)
     return rowcount
 
 
@@ -306,7 +315,9 @@ async def bulk_upsert_sellers(
 ) -> int:
     """Bulk upsert sellers."""
     debug_logger.debug(
-        f"Starting bulk_upsert_sellers with {len(sellers)} sellers, platform: {platform}"
+        "Starting bulk_upsert_sellers with %d sellers, platform: %s",
+        len(sellers),
+        platform,
     )
     if not sellers:
         debug_logger.debug("No sellers provided, returning 0")
@@ -314,7 +325,7 @@ async def bulk_upsert_sellers(
 
     # Deduplicate by ID (keep last occurrence)
     original_count = len(sellers)
-    debug_logger.debug(f"Deduplicating {original_count} sellers by ID")
+    debug_logger.debug("Deduplicating %d sellers by ID", original_count)
     seen_ids = {}
     for s in sellers:
         seen_ids[s["id"]] = s
@@ -322,12 +333,15 @@ async def bulk_upsert_sellers(
 
     # Debug logging
     debug_logger.debug(
-        f"After deduplication: {len(sellers)} unique sellers (removed {original_count - len(sellers)} duplicates)"
+        "After deduplication: %d unique sellers (removed %d duplicates)",
+        len(sellers),
+        original_count - len(sellers),
     )
     logger.info(
         f"Deduplicating sellers: received batch, after dedup have {len(sellers)} unique sellers"
     )
 
+    now = datetime.utcnow()
     values = []
     for s in sellers:
         values.append(
@@ -345,8 +359,8 @@ async def bulk_upsert_sellers(
                 "registration_date": s.get("registration_date"),
                 "account_id": s.get("account_id"),
                 "raw_data": s.get("raw_data"),  # FIX: Added raw_data field
-                "last_seen_at": datetime.utcnow(),
-                "updated_at": datetime.utcnow(),
+                "last_seen_at": now,
+                "updated_at": now,
             }
         )
 
@@ -371,29 +385,32 @@ async def bulk_upsert_sellers(
     debug_logger.debug("Executing sellers bulk upsert statement")
     result = await session.execute(stmt)
     rowcount = result.rowcount
-    debug_logger.debug(f"Sellers bulk upsert completed, affected rows: {rowcount}")
+    debug_logger.debug("Sellers bulk upsert completed, affected rows: %s", rowcount)
     return rowcount
 
 
 @deadlock_retry
 async def bulk_upsert_skus(session: AsyncSession, skus: List[Dict[str, Any]]) -> int:
     """Bulk upsert SKUs."""
-    debug_logger.debug(f"Starting bulk_upsert_skus with {len(skus)} SKUs")
+    debug_logger.debug("Starting bulk_upsert_skus with %d SKUs", len(skus))
     if not skus:
         debug_logger.debug("No SKUs provided, returning 0")
         return 0
 
     # Deduplicate by ID (keep last occurrence)
     original_count = len(skus)
-    debug_logger.debug(f"Deduplicating {original_count} SKUs by ID")
+    debug_logger.debug("Deduplicating %d SKUs by ID", original_count)
     seen_ids = {}
     for s in skus:
         seen_ids[s["id"]] = s
     skus = list(seen_ids.values())
     debug_logger.debug(
-        f"After deduplication: {len(skus)} unique SKUs (removed {original_count - len(skus)} duplicates)"
+        "After deduplication: %d unique SKUs (removed %d duplicates)",
+        len(skus),
+        original_count - len(skus),
     )
 
+    now = datetime.utcnow()
     values = []
     for s in skus:
         # Convert barcode to string if it's an integer
@@ -411,8 +428,8 @@ async def bulk_upsert_skus(session: AsyncSession, skus: List[Dict[str, Any]]) ->
                 "available_amount": s.get("available_amount", 0),
                 "barcode": barcode,
                 "characteristics": s.get("characteristics"),
-                "last_seen_at": datetime.utcnow(),
-                "updated_at": datetime.utcnow(),
+                "last_seen_at": now,
+                "updated_at": now,
             }
         )
 
@@ -432,7 +449,7 @@ async def bulk_upsert_skus(session: AsyncSession, skus: List[Dict[str, Any]]) ->
     debug_logger.debug("Executing SKUs bulk upsert statement")
     result = await session.execute(stmt)
     rowcount = result.rowcount
-    debug_logger.debug(f"SKUs bulk upsert completed, affected rows: {rowcount}")
+    debug_logger.debug("SKUs bulk upsert completed, affected rows: %s", rowcount)
     return rowcount
 
 
@@ -441,7 +458,7 @@ async def bulk_insert_price_history(
 ) -> int:
     """Bulk insert price history (no upsert, always insert)."""
     debug_logger.debug(
-        f"Starting bulk_insert_price_history with {len(prices)} price records"
+        "Starting bulk_insert_price_history with %d price records", len(prices)
     )
     if not prices:
         debug_logger.debug("No price records provided, returning 0")
@@ -463,13 +480,13 @@ async def bulk_insert_price_history(
             }
         )
 
-    debug_logger.debug(f"Prepared {len(values)} price history values for bulk insert")
+    debug_logger.debug("Prepared %d price history values for bulk insert", len(values))
     stmt = insert(PriceHistory).values(values)
     debug_logger.debug("Executing price history bulk insert statement")
     result = await session.execute(stmt)
     rowcount = result.rowcount
     debug_logger.debug(
-        f"Price history bulk insert completed, affected rows: {rowcount}"
+        "Price history bulk insert completed, affected rows: %s", rowcount
     )
     return rowcount
 
@@ -478,24 +495,27 @@ async def bulk_upsert_uzex_lots(
     session: AsyncSession, lots: List[Dict[str, Any]]
 ) -> int:
     """Bulk upsert UZEX lots."""
-    debug_logger.debug(f"Starting bulk_upsert_uzex_lots with {len(lots)} UZEX lots")
+    debug_logger.debug("Starting bulk_upsert_uzex_lots with %d UZEX lots", len(lots))
     if not lots:
         debug_logger.debug("No UZEX lots provided, returning 0")
         return 0
 
     # Deduplicate by ID (keep last occurrence)
     original_count = len(lots)
-    debug_logger.debug(f"Deduplicating {original_count} UZEX lots by ID")
+    debug_logger.debug("Deduplicating %d UZEX lots by ID", original_count)
     seen_ids = {}
     for lot in lots:
         seen_ids[lot["id"]] = lot
     lots = list(seen_ids.values())
     debug_logger.debug(
-        f"After deduplication: {len(lots)} unique lots (removed {original_count - len(lots)} duplicates)"
+        "After deduplication: %d unique lots (removed %d duplicates)",
+        len(lots),
+        original_count - len(lots),
     )
 
     from src.platforms.uzex.models import UzexLot
 
+    now = datetime.utcnow()
     values = []
     for lot in lots:
         values.append(
@@ -521,7 +541,7 @@ async def bulk_upsert_uzex_lots(
                 "lot_end_date": lot.get("lot_end_date"),
                 "kazna_status": lot.get("kazna_status"),
                 "raw_data": lot.get("raw_data"),
-                "updated_at": datetime.utcnow(),
+                "updated_at": now,
             }
         )
 
@@ -540,7 +560,7 @@ async def bulk_upsert_uzex_lots(
     debug_logger.debug("Executing UZEX lots bulk upsert statement")
     result = await session.execute(stmt)
     rowcount = result.rowcount
-    debug_logger.debug(f"UZEX lots bulk upsert completed, affected rows: {rowcount}")
+    debug_logger.debug("UZEX lots bulk upsert completed, affected rows: %s", rowcount)
     return rowcount
 
 
@@ -549,7 +569,7 @@ async def bulk_insert_uzex_items(
 ) -> int:
     """Bulk insert UZEX lot items."""
     debug_logger.debug(
-        f"Starting bulk_insert_uzex_items with {len(items)} UZEX lot items"
+        "Starting bulk_insert_uzex_items with %d UZEX lot items", len(items)
     )
     if not items:
         debug_logger.debug("No UZEX lot items provided, returning 0")
@@ -576,12 +596,12 @@ async def bulk_insert_uzex_items(
             }
         )
 
-    debug_logger.debug(f"Prepared {len(values)} UZEX lot item values for bulk insert")
+    debug_logger.debug("Prepared %d UZEX lot item values for bulk insert", len(values))
     stmt = insert(UzexLotItem).values(values)
     debug_logger.debug("Executing UZEX lot items bulk insert statement")
     result = await session.execute(stmt)
     rowcount = result.rowcount
     debug_logger.debug(
-        f"UZEX lot items bulk insert completed, affected rows: {rowcount}"
+        "UZEX lot items bulk insert completed, affected rows: %s", rowcount
     )
     return rowcount
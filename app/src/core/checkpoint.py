@@ -51,9 +51,9 @@ class CheckpointManager:
     async def connect(self) -> bool:
         """Connect to Redis."""
         debug_logger.debug(
-            f"Attempting Redis connection for checkpoint manager: {self.key}"
+            "Attempting Redis connection for checkpoint manager: %s", self.key
         )
-        debug_logger.debug(f"Redis URL: {settings.redis.url}")
+        debug_logger.debug("Redis URL: %s", settings.redis.url)
         try:
             self._redis = await aioredis.from_url(
                 settings.redis.url, encoding="utf-8", decode_responses=True
@@ -61,22 +61,22 @@ class CheckpointManager:
             debug_logger.debug("Redis client created, attempting ping")
             await self._redis.ping()
             logger.info(f"Checkpoint manager connected for {self.key}")
-            debug_logger.debug(f"Redis connection successful for {self.key}")
+            debug_logger.debug("Redis connection successful for %s", self.key)
             return True
         except Exception as e:
             logger.warning(f"Redis unavailable, using file-based checkpoints: {e}")
             debug_logger.debug(
-                f"Redis connection failed for {self.key}: {type(e).__name__}: {str(e)}"
+                "Redis connection failed for %s: %s: %s", self.key, type(e).__name__, e
             )
             debug_logger.debug(
-                f"Will use file-based checkpoints: {self._local_checkpoint_file}"
+                "Will use file-based checkpoints: %s", self._local_checkpoint_file
             )
             self._redis = None
             return False
 
     async def close(self):
         """Close connection."""
-        debug_logger.debug(f"Closing checkpoint manager for {self.key}")
+        debug_logger.debug("Closing checkpoint manager for %s", self.key)
         if self._redis:
             debug_logger.debug("Closing Redis connection")
             await self._redis.aclose()
@@ -101,16 +101,18 @@ class CheckpointManager:
             "started_at": "2024-01-01T12:00:00Z"
         }
         """
-        debug_logger.debug(f"Saving checkpoint for {self.key}: {data}")
+        debug_logger.debug("Saving checkpoint for %s: %s", self.key, data)
         data["updated_at"] = datetime.now(timezone.utc).isoformat()
-        debug_logger.debug(f"Added timestamp to checkpoint data: {data['updated_at']}")
+        debug_logger.debug("Added timestamp to checkpoint data: %s", data["updated_at"])
 
         if self._redis:
             debug_logger.debug(
-                f"Saving checkpoint to Redis with key: {self.CHECKPOINT_PREFIX}{self.key}"
+                "Saving checkpoint to Redis with key: %s%s",
+                self.CHECKPOINT_PREFIX,
+                self.key,
             )
             json_data = json.dumps(data)
-            debug_logger.debug(f"Serialized checkpoint data: {len(json_data)} chars")
+            debug_logger.debug("Serialized checkpoint data: %d chars", len(json_data))
             await self._redis.set(f"{self.CHECKPOINT_PREFIX}{self.key}", json_data)
             debug_logger.debug("Checkpoint saved to Redis successfully")
         else:
@@ -118,7 +120,7 @@ class CheckpointManager:
             self._save_to_file(data)
             debug_logger.debug("Checkpoint saved to file successfully")
 
-        logger.debug(f"Checkpoint saved: {data}")
+        logger.debug("Checkpoint saved: %s", data)
 
     async def load_checkpoint(self) -> Optional[Dict[str, Any]]:
         """Load last checkpoint."""
@@ -132,21 +134,23 @@ class CheckpointManager:
 
     async def clear_checkpoint(self):
         """Clear checkpoint (start fresh)."""
-        debug_logger.debug(f"Clearing checkpoint for {self.key}")
+        debug_logger.debug("Clearing checkpoint for %s", self.key)
 
         if self._redis:
             debug_logger.debug(
-                f"Deleting checkpoint from Redis with key: {self.CHECKPOINT_PREFIX}{self.key}"
+                "Deleting checkpoint from Redis with key: %s%s",
+                self.CHECKPOINT_PREFIX,
+                self.key,
             )
             result = await self._redis.delete(f"{self.CHECKPOINT_PREFIX}{self.key}")
-            debug_logger.debug(f"Redis delete result: {result} keys deleted")
+            debug_logger.debug("Redis delete result: %s keys deleted", result)
         else:
             debug_logger.debug(
-                f"Checking for local checkpoint file: {self._local_checkpoint_file}"
+                "Checking for local checkpoint file: %s", self._local_checkpoint_file
             )
             if self._local_checkpoint_file.exists():
                 debug_logger.debug(
-                    f"Deleting local checkpoint file: {self._local_checkpoint_file}"
+                    "Deleting local checkpoint file: %s", self._local_checkpoint_file
                 )
                 self._local_checkpoint_file.unlink()
                 debug_logger.debug("Local checkpoint file deleted")
@@ -154,7 +158,7 @@ class CheckpointManager:
                 debug_logger.debug("No local checkpoint file to delete")
 
         logger.info(f"Checkpoint cleared for {self.key}")
-        debug_logger.debug(f"Checkpoint clearing completed for {self.key}")
+        debug_logger.debug("Checkpoint clearing completed for %s", self.key)
 
     # =========================================================================
     # Deduplication (Seen IDs)
@@ -164,23 +168,26 @@ class CheckpointManager:
         """
         Mark IDs as seen. Returns number of NEW ids.
         """
-        debug_logger.debug(f"Marking {len(ids)} IDs as seen for {self.key}")
+        debug_logger.debug("Marking %d IDs as seen for %s", len(ids), self.key)
         if not ids:
             debug_logger.debug("No IDs provided, returning 0")
             return 0
 
-        debug_logger.debug(
-            f"IDs to mark as seen: {ids[:10]}{'...' if len(ids) > 10 else ''}"
-        )
+        if debug_logger.isEnabledFor(logging.DEBUG):
+            debug_logger.debug(
+                "IDs to mark as seen: %s%s", ids[:10], "..." if len(ids) > 10 else ""
+            )
 
         if self._redis:
-            debug_logger.debug(f"Adding IDs to Redis set: {self.SEEN_PREFIX}{self.key}")
+            debug_logger.debug(
+                "Adding IDs to Redis set: %s%s", self.SEEN_PREFIX, self.key
+            )
             str_ids = [str(i) for i in ids]
-            debug_logger.debug(f"Converted {len(str_ids)} IDs to strings")
+            debug_logger.debug("Converted %d IDs to strings", len(str_ids))
             new_count = await self._redis.sadd(
                 f"{self.SEEN_PREFIX}{self.key}", *str_ids
             )
-            debug_logger.debug(f"Redis SADD result: {new_count} new IDs added")
+            debug_logger.debug("Redis SADD result: %s new IDs added", new_count)
             return new_count
         else:
             debug_logger.debug(
@@ -191,61 +198,54 @@ class CheckpointManager:
     async def filter_unseen(self, ids: list) -> list:
         """
         Filter list to only unseen IDs.
-        Uses Redis pipeline for atomic bulk checking.
+        Uses a single SMISMEMBER call (Redis >= 6.2) for the whole batch.
         """
         if not ids or not self._redis:
             return ids
 
-        # Use pipeline for atomic bulk check (much faster, reduces race condition)
-        seen_key = f"{self.SEEN_PREFIX}{self.key}"
-        pipe = self._redis.pipeline()
-
-        for id_ in ids:
-            pipe.sismember(seen_key, str(id_))
-
-        # Execute all checks atomically
-        results = await pipe.execute()
+        # One round trip for the whole batch instead of one per ID
+        results = await self._redis.smismember(
+            f"{self.SEEN_PREFIX}{self.key}", [str(id_) for id_ in ids]
+        )
 
         # Filter to unseen only
-        unseen = [ids[i] for i, is_seen in enumerate(results) if not is_seen]
-
-        return unseen
+        return [id_ for id_, is_seen in zip(ids, results) if not is_seen]
 
     async def is_seen(self, id_: Any) -> bool:
         """Check if ID was already scraped."""
-        debug_logger.debug(f"Checking if ID {id_} is seen for {self.key}")
+        debug_logger.debug("Checking if ID %s is seen for %s", id_, self.key)
         if self._redis:
-            debug_logger.debug(f"Checking Redis set: {self.SEEN_PREFIX}{self.key}")
+            debug_logger.debug("Checking Redis set: %s%s", self.SEEN_PREFIX, self.key)
             result = await self._redis.sismember(
                 f"{self.SEEN_PREFIX}{self.key}", str(id_)
             )
-            debug_logger.debug(f"ID {id_} seen status: {result}")
+            debug_logger.debug("ID %s seen status: %s", id_, result)
             return result
         debug_logger.debug("Redis not available, returning False (unseen)")
         return False
 
     async def seen_count(self) -> int:
         """Get count of seen IDs."""
-        debug_logger.debug(f"Getting seen count for {self.key}")
+        debug_logger.debug("Getting seen count for %s", self.key)
         if self._redis:
-            debug_logger.debug(f"Counting Redis set: {self.SEEN_PREFIX}{self.key}")
+            debug_logger.debug("Counting Redis set: %s%s", self.SEEN_PREFIX, self.key)
             count = await self._redis.scard(f"{self.SEEN_PREFIX}{self.key}")
-            debug_logger.debug(f"Seen count: {count}")
+            debug_logger.debug("Seen count: %s", count)
             return count
         debug_logger.debug("Redis not available, returning 0")
         return 0
 
     async def clear_seen(self):
         """Clear seen set (rescrape everything)."""
-        debug_logger.debug(f"Clearing seen set for {self.key}")
+        debug_logger.debug("Clearing seen set for %s", self.key)
         if self._redis:
-            debug_logger.debug(f"Deleting Redis set: {self.SEEN_PREFIX}{self.key}")
+            debug_logger.debug("Deleting Redis set: %s%s", self.SEEN_PREFIX, self.key)
             result = await self._redis.delete(f"{self.SEEN_PREFIX}{self.key}")
-            debug_logger.debug(f"Redis delete result: {result} keys deleted")
+            debug_logger.debug("Redis delete result: %s keys deleted", result)
         else:
             debug_logger.debug("Redis not available, no seen set to clear")
         logger.info(f"Seen set cleared for {self.key}")
-        debug_logger.debug(f"Seen set clearing completed for {self.key}")
+        debug_logger.debug("Seen set clearing completed for %s", self.key)
 
     # =========================================================================
     # File-based fallback
@@ -255,11 +255,11 @@ class CheckpointManager:
         """
         Save checkpoint to file with file locking to prevent corruption.
         """
-        debug_logger.debug(f"Saving checkpoint to file: {self._local_checkpoint_file}")
+        debug_logger.debug("Saving checkpoint to file: %s", self._local_checkpoint_file)
         import fcntl
 
         debug_logger.debug(
-            f"Creating parent directories for {self._local_checkpoint_file.parent}"
+            "Creating parent directories for %s", self._local_checkpoint_file.parent
         )
         self._local_checkpoint_file.parent.mkdir(parents=True, exist_ok=True)
 
@@ -270,7 +270,7 @@ class CheckpointManager:
             fcntl.flock(f.fileno(), fcntl.LOCK_EX)
             try:
                 debug_logger.debug(
-                    f"Writing checkpoint data to file: {len(str(data))} chars"
+                    "Writing checkpoint data to file: %d keys", len(data)
                 )
                 json.dump(data, f, indent=2)
                 debug_logger.debug("Checkpoint data written to file successfully")
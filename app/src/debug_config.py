@@ -26,11 +26,31 @@ Usage:
     enable_project_debug(log_to_console=False, log_to_file=True)
 """
 
+import atexit
 import logging
+import os
+import queue
+import re
 import sys
-from datetime import datetime
+import threading
+import time
+from functools import lru_cache
+from logging.handlers import (
+    MemoryHandler,
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+)
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Union
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+import orjson
+
+
+def _dumps(obj) -> bytes:
+    """Serialize obj as indented JSON bytes."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
 
 # Import Yandex-specific debug config for integration
 try:
@@ -48,17 +68,82 @@ except ImportError:
             "CRITICAL": "\033[35m",
         }
         RESET = "\033[0m"
+        COLORED_LEVELNAMES: Dict[str, str] = {}
 
         def format(self, record):
-            if record.levelname in self.COLORS:
-                record.levelname = (
-                    f"{self.COLORS[record.levelname]}{record.levelname}{self.RESET}"
-                )
-            return super().format(record)
+            levelname = record.levelname
+            record.levelname = self.COLORED_LEVELNAMES.get(levelname, levelname)
+            try:
+                return super().format(record)
+            finally:
+                # Other handlers (e.g. the log file) see the same record
+                record.levelname = levelname
+
+    # Colorized level names, built once at import instead of per record
+    ColoredFormatter.COLORED_LEVELNAMES = {
+        level: f"{color}{level}{ColoredFormatter.RESET}"
+        for level, color in ColoredFormatter.COLORS.items()
+    }
 
     YandexDebugConfig = None
 
 
+class _FastRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that tracks the file size in memory.
+
+    The stock shouldRollover() seeks and stats the log file on every record;
+    here the size is counted as records are formatted and only re-synced on
+    rollover. Sizes are counted in characters, so rotation is approximate for
+    non-ASCII output.
+    """
+
+    def __init__(self, filename, *args, **kwargs):
+        super().__init__(filename, *args, **kwargs)
+        # Rotating only makes sense for regular files, check once up front
+        self._rotatable = not os.path.exists(self.baseFilename) or os.path.isfile(
+            self.baseFilename
+        )
+        try:
+            self._bytes_written = os.path.getsize(self.baseFilename)
+        except OSError:
+            self._bytes_written = 0
+
+    def format(self, record):
+        msg = super().format(record)
+        self._bytes_written += len(msg) + 1  # + terminator
+        return msg
+
+    def shouldRollover(self, record):
+        return (
+            self._rotatable
+            and self.maxBytes > 0
+            and self._bytes_written >= self.maxBytes
+        )
+
+    def doRollover(self):
+        super().doRollover()
+        self._bytes_written = 0
+
+
+# Size strings like '100MB' for max_file_size
+_SIZE_RE = re.compile(r"^\s*(\d+)\s*(KB|MB|GB|B)?\s*$", re.IGNORECASE)
+_SIZE_MULTIPLIERS = {None: 1, "B": 1, "KB": 1024, "MB": 1024**2, "GB": 1024**3}
+
+
+def _build_platform_index(
+    platform_loggers: Dict[str, List[str]],
+) -> Dict[str, frozenset]:
+    """Map platform name (src.platforms.<name>...) to its logger names."""
+    index: Dict[str, Set[str]] = {}
+    for names in platform_loggers.values():
+        for name in names:
+            platform = name.split(".")[2]
+            if platform != "base":  # Shared by every platform, always kept
+                index.setdefault(platform, set()).add(name)
+    return {platform: frozenset(names) for platform, names in index.items()}
+
+
 class ProjectDebugConfig:
     """
     Comprehensive debug configuration for the entire Scrapy platform.
@@ -167,6 +252,18 @@ class ProjectDebugConfig:
         },
     }
 
+    # Record formats: the default includes caller info, the fast one skips
+    # the funcName/lineno lookup entirely
+    DEFAULT_FORMAT = "%(asctime)s | %(name)-30s | %(levelname)-8s | %(funcName)s:%(lineno)d | %(message)s"
+    FAST_FORMAT = "%(asctime)s | %(name)s | %(levelname)s | %(message)s"
+
+    # File output is buffered; flushed when full, on ERROR, or on this interval
+    FILE_BUFFER_CAPACITY = 1024
+    FILE_FLUSH_INTERVAL = 30.0
+
+    # Platform name -> logger names, used by the `platforms` filter
+    _PLATFORM_INDEX = _build_platform_index(PROJECT_LOGGERS["platforms"])
+
     # SQLAlchemy and external library loggers
     EXTERNAL_LOGGERS = {
         "sqlalchemy": [
@@ -198,6 +295,14 @@ class ProjectDebugConfig:
     def __init__(self):
         self.handlers = []
         self.original_levels = {}
+        self._queue_handler: Optional[QueueHandler] = None
+        self._attached_loggers: Set[logging.Logger] = set()
+        self._enabled = False
+        self._config_key: Optional[str] = None
+        self._listener: Optional[QueueListener] = None
+        self._saved_record_flags: Optional[Dict[str, object]] = None
+        self._flush_stop: Optional[threading.Event] = None
+        self._flush_thread: Optional[threading.Thread] = None
         self.yandex_debug_config = None
 
         # Initialize Yandex debug config if available
@@ -217,6 +322,8 @@ class ProjectDebugConfig:
         backup_count: int = 5,
         console_level: str = "DEBUG",
         file_level: str = "DEBUG",
+        fast_format: bool = False,
+        platforms: Optional[List[str]] = None,
     ):
         """
         Enable comprehensive debug logging for the project.
@@ -234,7 +341,20 @@ class ProjectDebugConfig:
             backup_count: Number of backup files to keep
             console_level: Log level for console output
             file_level: Log level for file output
+            fast_format: Drop funcName/lineno from records and skip the stack
+                         frame lookup that collects them
+            platforms: Limit platform loggers to these platforms, e.g. ['uzum']
+                       (None = all platforms)
         """
+        # Already enabled with the same settings: nothing to do
+        config = dict(locals())
+        del config["self"]
+        config_key = repr(sorted(config.items()))
+        if self._enabled:
+            if config_key == self._config_key:
+                return
+            self.disable_project_debug()
+
         print("🚀 Enabling Scrapy project-wide debug logging...")
 
         # Default to all components if none specified
@@ -251,21 +371,40 @@ class ProjectDebugConfig:
             components = [c for c in components if c in self.PROJECT_LOGGERS]
 
         # Gather loggers to configure
-        debug_loggers = []
-        standard_loggers = []
+        debug_loggers, standard_loggers = self._resolve_loggers(
+            tuple(sorted(components))
+        )
 
-        for component in components:
-            debug_loggers.extend(self.PROJECT_LOGGERS[component]["debug"])
-            standard_loggers.extend(self.PROJECT_LOGGERS[component]["standard"])
+        if platforms and "platforms" in components:
+            valid_platforms = [p for p in platforms if p in self._PLATFORM_INDEX]
+            invalid_platforms = [p for p in platforms if p not in self._PLATFORM_INDEX]
+            if invalid_platforms:
+                print(f"⚠️  Invalid platforms ignored: {invalid_platforms}")
+
+            # Drop loggers of platforms that were not asked for; with no
+            # valid names left, keep every platform logger
+            if valid_platforms:
+                print(f"🏪 Limiting platform loggers to: {valid_platforms}")
+                excluded = set().union(
+                    *(
+                        names
+                        for platform, names in self._PLATFORM_INDEX.items()
+                        if platform not in valid_platforms
+                    )
+                )
+                debug_loggers = tuple(
+                    lg for lg in debug_loggers if lg.name not in excluded
+                )
+                standard_loggers = tuple(
+                    lg for lg in standard_loggers if lg.name not in excluded
+                )
 
         print(f"🔧 Configuring {len(debug_loggers)} debug loggers")
         print(f"📊 Configuring {len(standard_loggers)} standard loggers")
 
         # Store original levels for restoration
-        all_loggers = debug_loggers + standard_loggers
-        for logger_name in all_loggers:
-            logger = logging.getLogger(logger_name)
-            self.original_levels[logger_name] = logger.level
+        for logger in debug_loggers + standard_loggers:
+            self.original_levels[logger.name] = logger.level
 
         # Create handlers
         self._create_handlers(
@@ -276,8 +415,24 @@ class ProjectDebugConfig:
             file_level,
             max_file_size,
             backup_count,
+            fast_format,
         )
 
+        if fast_format:
+            self._disable_record_introspection()
+
+        # Route records through a queue so console/file I/O runs on the
+        # listener thread instead of blocking the logging caller
+        log_queue = queue.SimpleQueue()
+        self._queue_handler = QueueHandler(log_queue)
+        self._listener = QueueListener(
+            log_queue, *self.handlers, respect_handler_level=True
+        )
+        self._listener.start()
+        # Don't lose queued or buffered records if the process exits
+        # without disabling
+        atexit.register(self._drain_at_exit)
+
         # Configure debug loggers (most verbose)
         self._configure_loggers(debug_loggers, logging.DEBUG)
 
@@ -295,9 +450,30 @@ class ProjectDebugConfig:
             print("🔍 Integrating Yandex-specific debug configuration...")
             # The Yandex debug config will be managed separately to avoid conflicts
 
+        self._enabled = True
+        self._config_key = config_key
+
         print("✅ Project-wide debug logging enabled successfully!")
         self._print_debug_summary(components, include_external_libs)
 
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _resolve_loggers(
+        cls, components: Tuple[str, ...]
+    ) -> Tuple[Tuple[logging.Logger, ...], Tuple[logging.Logger, ...]]:
+        """Resolve (debug, standard) logger objects for a set of components, once."""
+        debug_loggers = tuple(
+            logging.getLogger(name)
+            for component in components
+            for name in cls.PROJECT_LOGGERS[component]["debug"]
+        )
+        standard_loggers = tuple(
+            logging.getLogger(name)
+            for component in components
+            for name in cls.PROJECT_LOGGERS[component]["standard"]
+        )
+        return debug_loggers, standard_loggers
+
     def _create_handlers(
         self,
         log_to_console,
@@ -307,15 +483,18 @@ class ProjectDebugConfig:
         file_level,
         max_file_size,
         backup_count,
+        fast_format=False,
     ):
         """Create logging handlers for console and/or file output."""
+        fmt = self.FAST_FORMAT if fast_format else self.DEFAULT_FORMAT
 
-        # Console handler with colors
+        # Console handler, colored only for interactive terminals
         if log_to_console:
             console_handler = logging.StreamHandler(sys.stdout)
             console_handler.setLevel(getattr(logging, console_level.upper()))
-            console_formatter = ColoredFormatter(
-                fmt="%(asctime)s | %(name)-30s | %(levelname)-8s | %(funcName)s:%(lineno)d | %(message)s",
+            formatter_cls = ColoredFormatter if self._use_color() else logging.Formatter
+            console_formatter = formatter_cls(
+                fmt=fmt,
                 datefmt="%H:%M:%S",
             )
             console_handler.setFormatter(console_formatter)
@@ -325,41 +504,113 @@ class ProjectDebugConfig:
         # File handler with rotation
         if log_to_file:
             if not log_file:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                timestamp = time.strftime("%Y%m%d_%H%M%S")
                 log_file = f"scrapy_debug_{timestamp}.log"
 
             log_path = Path(log_file)
             log_path.parent.mkdir(parents=True, exist_ok=True)
 
-            from logging.handlers import RotatingFileHandler
-
-            file_handler = RotatingFileHandler(
+            file_handler = _FastRotatingFileHandler(
                 log_file,
                 maxBytes=self._parse_size(max_file_size),
                 backupCount=backup_count,
             )
             file_handler.setLevel(getattr(logging, file_level.upper()))
             file_formatter = logging.Formatter(
-                fmt="%(asctime)s | %(name)-30s | %(levelname)-8s | %(funcName)s:%(lineno)d | %(message)s",
+                fmt=fmt,
                 datefmt="%Y-%m-%d %H:%M:%S",
             )
             file_handler.setFormatter(file_formatter)
-            self.handlers.append(file_handler)
+
+            # Batch writes in memory; ERROR and above are written immediately
+            buffered_handler = MemoryHandler(
+                capacity=self.FILE_BUFFER_CAPACITY,
+                flushLevel=logging.ERROR,
+                target=file_handler,
+                flushOnClose=True,
+            )
+            buffered_handler.setLevel(file_handler.level)
+            self.handlers.append(buffered_handler)
+            self._start_periodic_flush(buffered_handler)
             print(f"📄 File logging enabled: {log_file} (level: {file_level})")
 
-    def _configure_loggers(self, logger_names: List[str], level: int):
+    @staticmethod
+    def _use_color() -> bool:
+        """Whether console output should be colored (FORCE_COLOR / NO_COLOR aware)."""
+        if os.environ.get("FORCE_COLOR"):
+            return True
+        if os.environ.get("NO_COLOR") is not None:
+            return False
+        return sys.stdout.isatty()
+
+    def _start_periodic_flush(self, handler: MemoryHandler):
+        """Flush the buffered file handler every FILE_FLUSH_INTERVAL seconds."""
+        self._flush_stop = threading.Event()
+        stop = self._flush_stop
+
+        def _run():
+            while not stop.wait(self.FILE_FLUSH_INTERVAL):
+                handler.flush()
+
+        self._flush_thread = threading.Thread(
+            target=_run, name="debug-log-flush", daemon=True
+        )
+        self._flush_thread.start()
+
+    def _stop_periodic_flush(self):
+        """Stop the flush thread started by _start_periodic_flush()."""
+        if self._flush_stop:
+            self._flush_stop.set()
+            self._flush_thread.join()
+            self._flush_stop = None
+            self._flush_thread = None
+
+    def _drain_at_exit(self):
+        """Stop the listener, then flush and close the handlers it fed."""
+        if self._listener:
+            self._listener.stop()
+            self._listener = None
+        for handler in self.handlers:
+            target = getattr(handler, "target", None)
+            handler.flush()
+            handler.close()
+            if target:
+                target.close()
+
+    def _disable_record_introspection(self):
+        """Stop logging from collecting caller/thread/process info per record."""
+        if self._saved_record_flags is None:
+            self._saved_record_flags = {
+                "_srcfile": logging._srcfile,
+                "logThreads": logging.logThreads,
+                "logProcesses": logging.logProcesses,
+                "logMultiprocessing": logging.logMultiprocessing,
+            }
+        # With _srcfile unset Logger._log skips findCaller()'s frame walk
+        logging._srcfile = None
+        logging.logThreads = False
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+
+    def _restore_record_introspection(self):
+        """Undo _disable_record_introspection()."""
+        if self._saved_record_flags is None:
+            return
+        for name, value in self._saved_record_flags.items():
+            setattr(logging, name, value)
+        self._saved_record_flags = None
+
+    def _configure_loggers(self, loggers: Tuple[logging.Logger, ...], level: int):
         """Configure a list of loggers with the specified level."""
-        for logger_name in logger_names:
-            logger = logging.getLogger(logger_name)
+        for logger in loggers:
             logger.setLevel(level)
 
             # Remove existing handlers to avoid duplicates
-            for handler in logger.handlers[:]:
-                logger.removeHandler(handler)
+            logger.handlers.clear()
 
-            # Add our handlers
-            for handler in self.handlers:
-                logger.addHandler(handler)
+            # Add our queue handler (the listener fans out to real handlers)
+            logger.addHandler(self._queue_handler)
+            self._attached_loggers.add(logger)
 
             logger.propagate = False  # Prevent duplicate messages
 
@@ -374,9 +625,9 @@ class ProjectDebugConfig:
                 self.original_levels[logger_name] = logger.level
                 logger.setLevel(level_obj)
 
-                for handler in self.handlers:
-                    if handler not in logger.handlers:
-                        logger.addHandler(handler)
+                if logger not in self._attached_loggers:
+                    logger.addHandler(self._queue_handler)
+                    self._attached_loggers.add(logger)
 
                 external_count += 1
 
@@ -412,19 +663,33 @@ class ProjectDebugConfig:
             logger = logging.getLogger(logger_name)
             logger.setLevel(original_level)
 
-            # Remove our handlers
-            for handler in self.handlers:
-                if handler in logger.handlers:
-                    logger.removeHandler(handler)
+            # Remove our queue handler
+            if logger in self._attached_loggers:
+                logger.removeHandler(self._queue_handler)
 
             logger.propagate = True  # Restore normal propagation
 
-        # Close handlers
+        # Drain the queue before closing the real handlers
+        atexit.unregister(self._drain_at_exit)
+        if self._listener:
+            self._listener.stop()
+            self._listener = None
+        self._queue_handler = None
+        self._attached_loggers.clear()
+        self._stop_periodic_flush()
+
+        # Close handlers (MemoryHandler flushes on close but leaves its target open)
         for handler in self.handlers:
+            target = getattr(handler, "target", None)
             handler.close()
+            if target:
+                target.close()
 
         self.handlers.clear()
         self.original_levels.clear()
+        self._restore_record_introspection()
+        self._enabled = False
+        self._config_key = None
 
         # Disable Yandex debug if it was enabled
         if self.yandex_debug_config:
@@ -435,18 +700,16 @@ class ProjectDebugConfig:
 
         print("✅ Project-wide debug logging disabled, original levels restored")
 
-    def _parse_size(self, size_str: str) -> int:
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _parse_size(size_str: str) -> int:
         """Parse size string like '100MB' into bytes."""
-        size_str = size_str.upper()
-
-        if size_str.endswith("KB"):
-            return int(size_str[:-2]) * 1024
-        elif size_str.endswith("MB"):
-            return int(size_str[:-2]) * 1024 * 1024
-        elif size_str.endswith("GB"):
-            return int(size_str[:-2]) * 1024 * 1024 * 1024
-        else:
-            return int(size_str)  # Assume bytes
+        match = _SIZE_RE.match(size_str)
+        if not match:
+            raise ValueError(f"Invalid size: {size_str!r}")
+
+        number, unit = match.groups()
+        return int(number) * _SIZE_MULTIPLIERS[unit and unit.upper()]  # No unit = bytes
 
     def get_debug_status(self) -> Dict[str, any]:
         """Get comprehensive debug status for all components."""
@@ -456,20 +719,19 @@ class ProjectDebugConfig:
             "components": {},
         }
 
-        for component, loggers in self.PROJECT_LOGGERS.items():
+        for component in self.PROJECT_LOGGERS:
             component_status = {"debug_loggers": {}, "standard_loggers": {}}
+            debug_loggers, standard_loggers = self._resolve_loggers((component,))
 
-            for logger_name in loggers["debug"]:
-                logger = logging.getLogger(logger_name)
-                component_status["debug_loggers"][logger_name] = {
+            for logger in debug_loggers:
+                component_status["debug_loggers"][logger.name] = {
                     "level": logging.getLevelName(logger.level),
                     "handlers": len(logger.handlers),
                     "propagate": logger.propagate,
                 }
 
-            for logger_name in loggers["standard"]:
-                logger = logging.getLogger(logger_name)
-                component_status["standard_loggers"][logger_name] = {
+            for logger in standard_loggers:
+                component_status["standard_loggers"][logger.name] = {
                     "level": logging.getLevelName(logger.level),
                     "handlers": len(logger.handlers),
                     "propagate": logger.propagate,
@@ -479,6 +741,10 @@ class ProjectDebugConfig:
 
         return status
 
+    def get_debug_status_json(self) -> bytes:
+        """Get debug status serialized as indented JSON bytes."""
+        return _dumps(self.get_debug_status())
+
 
 # Global debug configuration instance
 _project_debug = ProjectDebugConfig()
@@ -500,6 +766,11 @@ def get_debug_status():
     return _project_debug.get_debug_status()
 
 
+def get_debug_status_json() -> bytes:
+    """Get current debug status as JSON bytes."""
+    return _project_debug.get_debug_status_json()
+
+
 # Preset configurations
 def enable_core_debug():
     """Enable debug only for core modules (database, bulk_ops, etc.)."""
@@ -609,8 +880,7 @@ def platform_debug_context(platform: str = None):
     """Context manager for platform debugging."""
     kwargs = {"components": ["platforms"]}
     if platform:
-        # Could add platform-specific filtering here
-        pass
+        kwargs["platforms"] = [platform]
     return DebugContext(**kwargs)
 
 
@@ -621,8 +891,6 @@ def worker_debug_context():
 
 # Example usage and testing
 if __name__ == "__main__":
-    import time
-
     print("🧪 Testing Scrapy project-wide debug configuration...")
 
     # Test development debug
@@ -639,13 +907,12 @@ if __name__ == "__main__":
     worker_logger.debug("⚙️  This is a worker debug message")
 
     print("\n📊 Debug status:")
-    import json
-
     status = get_debug_status()
     # Print a summary instead of full status (too large)
     print(f"Active handlers: {status['handlers_active']}")
     print(f"Configured loggers: {status['loggers_configured']}")
     print(f"Components: {list(status['components'].keys())}")
+    print(_dumps(status["components"]["core"]).decode())
 
     time.sleep(2)
 
@@ -3,6 +3,7 @@ Base Platform - Abstract interface for marketplace platforms.
 """
 
 import logging
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
@@ -13,8 +14,18 @@ logger = logging.getLogger(__name__)
 # Create debug logger for detailed troubleshooting
 debug_logger = logging.getLogger(f"{__name__}.debug")
 
+# Title normalization patterns (compiled once, used per product)
+_NON_WORD_RE = re.compile(r"[^\w\s]")
+_WHITESPACE_RE = re.compile(r"\s+")
 
-@dataclass
+
+def normalize_title_text(title: str) -> str:
+    """Lowercase a title, strip special characters and collapse whitespace."""
+    normalized = _NON_WORD_RE.sub("", title.lower())
+    return _WHITESPACE_RE.sub(" ", normalized).strip()
+
+
+@dataclass(slots=True)
 class ProductData:
     """Parsed product data."""
 
@@ -79,7 +90,7 @@ class MarketplacePlatform(ABC):
             Raw API response dict, or None if not found
         """
         debug_logger.debug(
-            f"[{self.name}] download_product called with product_id: {product_id}"
+            "[%s] download_product called with product_id: %s", self.name, product_id
         )
         pass
 
@@ -95,7 +106,9 @@ class MarketplacePlatform(ABC):
             Parsed ProductData, or None if invalid
         """
         debug_logger.debug(
-            f"[{self.name}] parse_product called with raw_data size: {len(str(raw_data)) if raw_data else 0} chars"
+            "[%s] parse_product called with %d top-level keys",
+            self.name,
+            len(raw_data) if raw_data else 0,
         )
         pass
 
@@ -114,12 +127,19 @@ class MarketplacePlatform(ABC):
         Yields:
             Raw product data dicts
         """
-        debug_logger.debug(
-            f"[{self.name}] download_range called: start_id={start_id}, end_id={end_id}, concurrency={concurrency}"
-        )
-        debug_logger.debug(
-            f"[{self.name}] Expected to process {end_id - start_id + 1} products"
-        )
+        if debug_logger.isEnabledFor(logging.DEBUG):
+            debug_logger.debug(
+                "[%s] download_range called: start_id=%s, end_id=%s, concurrency=%s",
+                self.name,
+                start_id,
+                end_id,
+                concurrency,
+            )
+            debug_logger.debug(
+                "[%s] Expected to process %d products",
+                self.name,
+                end_id - start_id + 1,
+            )
         pass
 
     @abstractmethod
@@ -130,20 +150,24 @@ class MarketplacePlatform(ABC):
         Returns:
             (min_id, max_id) tuple
         """
-        debug_logger.debug(f"[{self.name}] get_id_range called")
+        debug_logger.debug("[%s] get_id_range called", self.name)
         pass
 
     def normalize_title(self, title: str) -> str:
         """Normalize product title for matching across sellers."""
-        debug_logger.debug(
-            f"[{self.name}] Normalizing title: '{title}' (length: {len(title)})"
-        )
-        import re
-
-        # Remove special characters, lowercase, collapse whitespace
-        normalized = re.sub(r"[^\w\s]", "", title.lower())
-        normalized = re.sub(r"\s+", " ", normalized).strip()
-        debug_logger.debug(
-            f"[{self.name}] Normalized title: '{normalized}' (length: {len(normalized)})"
-        )
+        if debug_logger.isEnabledFor(logging.DEBUG):
+            debug_logger.debug(
+                "[%s] Normalizing title: '%s' (length: %d)",
+                self.name,
+                title,
+                len(title),
+            )
+        normalized = normalize_title_text(title)
+        if debug_logger.isEnabledFor(logging.DEBUG):
+            debug_logger.debug(
+                "[%s] Normalized title: '%s' (length: %d)",
+                self.name,
+                normalized,
+                len(normalized),
+            )
         return normalized
@@ -7,11 +7,13 @@ C2C Classifieds platform scraper based on research in scrape_researches/olx/
 import asyncio
 import aiohttp
 import logging
-import json
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 import random
+import time
+
+import orjson
 
 logger = logging.getLogger(__name__)
 debug_logger = logging.getLogger(f"{__name__}.debug")
@@ -38,12 +40,26 @@ class OLXClient:
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 Chrome/131.0.0.0 Safari/537.36",
     ]
     
+    # Fully assembled header sets, one per user agent (built once at import)
+    HEADER_POOL = tuple(
+        {
+            "Accept": "application/json",
+            "Accept-Language": "ru-RU,ru;q=0.9,uz;q=0.8",
+            "User-Agent": ua,
+        }
+        for ua in USER_AGENTS
+    )
+    
     def __init__(self, config: OLXConfig = None):
         self.config = config or OLXConfig()
         self._session: Optional[aiohttp.ClientSession] = None
         self._semaphore: Optional[asyncio.Semaphore] = None
         self._request_count = 0
-        self._last_request_time = 0.0
+        self._next_request_time = 0.0
+        
+        # Retry delays per attempt in seconds (index = attempt number)
+        self._retry_backoff = tuple(5.0 * 2 ** i for i in range(self.config.retries))
+        self._rate_limit_backoff = tuple(30.0 * (i + 1) for i in range(self.config.retries))
         
     async def __aenter__(self):
         await self._create_session()
@@ -58,16 +74,10 @@ class OLXClient:
             
         connector = aiohttp.TCPConnector(limit=self.config.concurrency, ttl_dns_cache=300)
         
-        headers = {
-            "Accept": "application/json",
-            "Accept-Language": "ru-RU,ru;q=0.9,uz;q=0.8",
-            "User-Agent": random.choice(self.USER_AGENTS),
-        }
-        
         self._session = aiohttp.ClientSession(
             connector=connector,
             timeout=aiohttp.ClientTimeout(total=self.config.timeout),
-            headers=headers
+            headers=random.choice(self.HEADER_POOL)
         )
         self._semaphore = asyncio.Semaphore(self.config.concurrency)
         logger.info(f"OLX client initialized - concurrency: {self.config.concurrency}")
@@ -78,17 +88,19 @@ class OLXClient:
             self._session = None
             
     async def _rate_limit(self):
-        current_time = asyncio.get_event_loop().time()
-        time_since_last = current_time - self._last_request_time
+        """Reserve the next request slot and wait for it.
         
-        if time_since_last < self.config.min_delay:
-            delay = self.config.min_delay - time_since_last
-            delay += random.uniform(0, self.config.max_delay - self.config.min_delay)
-            await asyncio.sleep(delay)
-            
-        self._last_request_time = asyncio.get_event_loop().time()
+        The slot is claimed before sleeping, so concurrent callers are
+        spaced min_delay..max_delay apart instead of waking together.
+        """
+        current_time = time.monotonic()
+        slot = max(current_time, self._next_request_time)
+        self._next_request_time = slot + random.uniform(self.config.min_delay, self.config.max_delay)
         self._request_count += 1
         
+        if slot > current_time:
+            await asyncio.sleep(slot - current_time)
+        
     async def _fetch_json(self, url: str, params: Dict = None) -> Optional[Dict]:
         if not self._session:
             await self._create_session()
@@ -96,26 +108,37 @@ class OLXClient:
         await self._rate_limit()
         
         for attempt in range(self.config.retries):
+            wait_time = None
             try:
                 async with self._semaphore:
                     async with self._session.get(url, params=params) as response:
                         if response.status == 200:
                             # OLX returns application/x-json which aiohttp rejects
-                            # So read as text and parse manually
-                            text = await response.text()
-                            data = json.loads(text)
-                            debug_logger.debug(f"Got JSON from {url}: {len(str(data))} chars")
+                            # So read the raw body and parse it directly
+                            body = await response.read()
+                            data = orjson.loads(body)
+                            debug_logger.debug("Got JSON from %s: %d bytes", url, len(body))
                             return data
-                        elif response.status == 429:
-                            wait_time = (attempt + 1) * 30
+                        if response.status == 429:
+                            # Respect the server's hint when it gives one, but never
+                            # wait longer than our own longest rate-limit backoff
+                            retry_after = response.headers.get("Retry-After", "")
+                            wait_time = (
+                                min(float(retry_after), self._rate_limit_backoff[-1])
+                                if retry_after.isdigit()
+                                else self._rate_limit_backoff[attempt]
+                            )
                             logger.warning(f"Rate limited on {url}, waiting {wait_time}s")
-                            await asyncio.sleep(wait_time)
                         else:
                             logger.debug(f"HTTP {response.status} for {url}")
-                            await asyncio.sleep(random.uniform(5, 15))
             except Exception as e:
                 logger.debug(f"Error fetching {url}: {e}")
-                await asyncio.sleep(random.uniform(5, 15))
+            
+            # Back off outside the semaphore; no sleep after the last attempt
+            if attempt < self.config.retries - 1:
+                if wait_time is None:
+                    wait_time = self._retry_backoff[attempt] + random.uniform(0, 5)
+                await asyncio.sleep(wait_time)
                 
         return None
         
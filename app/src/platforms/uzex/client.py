@@ -183,33 +183,32 @@ class UzexClient:
     
     async def _get(self, url: str) -> Optional[List[Dict]]:
         """Make GET request with session headers."""
-        headers = self._get_headers()
-        for attempt in range(self.retries):
-            try:
-                async with self._session.get(url, headers=headers) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    logger.warning(f"GET {url} returned {response.status}")
-                    return None
-            except Exception as e:
-                if attempt == self.retries - 1:
-                    logger.error(f"GET {url} failed: {e}")
-                await asyncio.sleep(1 * (attempt + 1))
-        return None
+        return await self._request("GET", url)
     
     async def _post(self, url: str, payload: Dict) -> Optional[List[Dict]]:
         """Make POST request with session headers."""
+        return await self._request("POST", url, payload)
+    
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        payload: Optional[Dict] = None
+    ) -> Optional[List[Dict]]:
+        """Make request with session headers and retry on connection errors."""
         headers = self._get_headers()
         for attempt in range(self.retries):
             try:
-                async with self._session.post(url, json=payload, headers=headers) as response:
+                async with self._session.request(
+                    method, url, json=payload, headers=headers
+                ) as response:
                     if response.status == 200:
                         return await response.json()
-                    logger.warning(f"POST {url} returned {response.status}")
+                    logger.warning(f"{method} {url} returned {response.status}")
                     return None
             except Exception as e:
                 if attempt == self.retries - 1:
-                    logger.error(f"POST {url} failed: {e}")
+                    logger.error(f"{method} {url} failed: {e}")
                 await asyncio.sleep(1 * (attempt + 1))
         return None
 
@@ -144,13 +144,21 @@ class UzexDownloader:
                     total_count = data[0].get("total_count", 0)
                     logger.info(f"Total available: {total_count:,}")
                 
+                # Check the whole page against the seen set in one round trip
+                if skip_existing:
+                    unseen = set(await checkpoint.filter_unseen(
+                        [item.get("lot_id") for item in data]
+                    ))
+                
                 # Process lots
                 for item in data:
                     lot_id = item.get("lot_id")
                     
                     # Skip if already seen
-                    if skip_existing and await checkpoint.is_seen(lot_id):
-                        continue
+                    if skip_existing:
+                        if lot_id not in unseen:
+                            continue
+                        unseen.discard(lot_id)
                     
                     lot = parser.parse_lot(item, lot_type, status)
                     if lot:
@@ -275,12 +283,18 @@ class UzexDownloader:
                         for i in lot.items
                     ]
                 }
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
+                # Disk write runs in a thread so it doesn't stall the event loop
+                await asyncio.to_thread(self._write_json, filepath, data)
         except Exception as e:
             self.stats.errors += 1
             logger.error(f"Save error: {e}")
 
+    @staticmethod
+    def _write_json(filepath: Path, data: Dict):
+        """Write data to a JSON file (blocking)."""
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
     def _process_lot(self, lot: LotData):
         """Convert LotData to dict and add to buffers."""
         try:
@@ -9,7 +9,7 @@ from datetime import datetime
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class LotItem:
     """Single item/product within a lot."""
     order_num: int
@@ -25,7 +25,7 @@ class LotItem:
     properties: Optional[List[Dict]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LotData:
     """Parsed lot/deal data."""
     id: int
@@ -4,8 +4,9 @@ Uzum API Client - Fast async client for Uzum.uz API.
 
 import asyncio
 import logging
+import random
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 import aiohttp
 from aiohttp import ClientTimeout, TCPConnector
@@ -28,7 +29,7 @@ class UzumClient:
     """
 
     API_BASE = "https://api.uzum.uz/api/v2"
-    PRODUCT_URL = f"{API_BASE}/product/{{product_id}}"
+    PRODUCT_URL_PREFIX = f"{API_BASE}/product/"
 
     DEFAULT_HEADERS = {
         "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
@@ -63,7 +64,10 @@ class UzumClient:
         """Initialize optimized connection pool for high-throughput."""
         debug_logger.debug("Initializing Uzum client connection pool")
         debug_logger.debug(
-            f"Configuration: concurrency={self.concurrency}, timeout={self.timeout}, retries={self.retries}"
+            "Configuration: concurrency=%s, timeout=%s, retries=%s",
+            self.concurrency,
+            self.timeout,
+            self.retries,
         )
         if self._session is None:
             connector = TCPConnector(
@@ -78,12 +82,15 @@ class UzumClient:
                 connector=connector,
                 timeout=ClientTimeout(total=self.timeout),
                 headers=self.DEFAULT_HEADERS,
+                # Stateless JSON API: skip Set-Cookie parsing on every response
+                cookie_jar=aiohttp.DummyCookieJar(),
             )
             self._semaphore = asyncio.Semaphore(self.concurrency)
             debug_logger.debug(
-                f"Uzum client session created with semaphore concurrency: {self.concurrency}"
+                "Uzum client session created with semaphore concurrency: %s",
+                self.concurrency,
             )
-            debug_logger.debug(f"Session headers: {list(self.DEFAULT_HEADERS.keys())}")
+            debug_logger.debug("Session headers: %s", list(self.DEFAULT_HEADERS))
 
     async def close(self):
         """Close connection pool."""
@@ -95,63 +102,81 @@ class UzumClient:
 
     async def fetch_product(self, product_id: int) -> Optional[Dict[str, Any]]:
         """Fetch with smart rate limiting."""
-        debug_logger.debug(f"Fetching Uzum product: {product_id}")
+        debug_logger.debug("Fetching Uzum product: %s", product_id)
         if self._session is None:
             debug_logger.debug("Session not initialized, connecting now")
             await self.connect()
 
-        url = self.PRODUCT_URL.format(product_id=product_id)
-        debug_logger.debug(f"Product URL: {url}")
+        url = f"{self.PRODUCT_URL_PREFIX}{product_id}"
+        debug_logger.debug("Product URL: %s", url)
 
         # Smart sleep to avoid pattern detection
-        import random
-
         await asyncio.sleep(random.uniform(self.min_sleep, self.max_sleep))
 
         for attempt in range(self.retries):
             try:
                 async with self._semaphore:
                     debug_logger.debug(
-                        f"Making request to {url} (attempt {attempt + 1}/{self.retries})"
+                        "Making request to %s (attempt %d/%d)",
+                        url,
+                        attempt + 1,
+                        self.retries,
                     )
                     async with self._session.get(url) as response:
                         debug_logger.debug(
-                            f"Response status for product {product_id}: {response.status}"
+                            "Response status for product %s: %s",
+                            product_id,
+                            response.status,
                         )
                         if response.status == 200:
                             data = await response.json()
                             payload = data.get("payload", {}).get("data", {})
                             debug_logger.debug(
-                                f"Product {product_id}: Payload available: {bool(payload)}"
+                                "Product %s: Payload available: %s",
+                                product_id,
+                                bool(payload),
                             )
                             if payload and payload.get("title"):
-                                debug_logger.debug(
-                                    f"Product {product_id}: Valid product data found with title: {payload.get('title')[:50]}..."
-                                )
+                                if debug_logger.isEnabledFor(logging.DEBUG):
+                                    debug_logger.debug(
+                                        "Product %s: Valid product data found with title: %s...",
+                                        product_id,
+                                        payload["title"][:50],
+                                    )
                                 return data
                             debug_logger.debug(
-                                f"Product {product_id}: No valid product data (empty payload or no title)"
+                                "Product %s: No valid product data (empty payload or no title)",
+                                product_id,
                             )
                             return None
                         elif response.status == 429:  # Rate limit
                             wait = (attempt + 1) * 2
                             logger.warning(f"Rate limited (429). Waiting {wait}s...")
                             debug_logger.debug(
-                                f"Product {product_id}: Rate limit hit, exponential backoff: {wait}s"
+                                "Product %s: Rate limit hit, exponential backoff: %ss",
+                                product_id,
+                                wait,
                             )
                             await asyncio.sleep(wait)
                             continue
                         elif response.status == 404:
-                            debug_logger.debug(f"Product {product_id}: Not found (404)")
+                            debug_logger.debug(
+                                "Product %s: Not found (404)", product_id
+                            )
                             return None
 
                         debug_logger.debug(
-                            f"Product {product_id}: Unexpected status {response.status}"
+                            "Product %s: Unexpected status %s",
+                            product_id,
+                            response.status,
                         )
                         return None
             except asyncio.TimeoutError:
                 debug_logger.debug(
-                    f"Timeout for product {product_id} (attempt {attempt + 1}/{self.retries})"
+                    "Timeout for product %s (attempt %d/%d)",
+                    product_id,
+                    attempt + 1,
+                    self.retries,
                 )
                 if attempt == self.retries - 1:
                     logger.debug(f"Final timeout for product {product_id}")
@@ -159,18 +184,21 @@ class UzumClient:
             except Exception as e:
                 logger.debug(f"Error fetching {product_id}: {e}")
                 debug_logger.debug(
-                    f"Product {product_id} error details: {type(e).__name__}: {str(e)}"
+                    "Product %s error details: %s: %s",
+                    product_id,
+                    type(e).__name__,
+                    e,
                 )
                 await asyncio.sleep(0.5)
 
         return None
 
-    async def fetch_batch(self, product_ids: List[int]) -> List[Dict[str, Any]]:
+    async def fetch_batch(self, product_ids: Iterable[int]) -> List[Dict[str, Any]]:
         """
         Fetch multiple products concurrently.
 
         Args:
-            product_ids: List of product IDs
+            product_ids: Product IDs (list or range)
 
         Returns:
             List of raw API responses (only valid ones)
@@ -207,7 +235,7 @@ class UzumClient:
         }
 
         while current_id < end_id:
-            batch_ids = list(range(current_id, min(current_id + batch_size, end_id)))
+            batch_ids = range(current_id, min(current_id + batch_size, end_id))
             products = await self.fetch_batch(batch_ids)
 
             stats["processed"] += len(batch_ids)
@@ -215,10 +243,17 @@ class UzumClient:
             stats["empty"] += len(batch_ids) - len(products)
 
             debug_logger.debug(
-                f"Batch {current_id}-{min(current_id + batch_size - 1, end_id)}: processed={len(batch_ids)}, found={len(products)}"
+                "Batch %s-%s: processed=%d, found=%d",
+                current_id,
+                min(current_id + batch_size - 1, end_id),
+                len(batch_ids),
+                len(products),
             )
             debug_logger.debug(
-                f"Running totals: processed={stats['processed']}, found={stats['found']}, empty={stats['empty']}"
+                "Running totals: processed=%d, found=%d, empty=%d",
+                stats["processed"],
+                stats["found"],
+                stats["empty"],
             )
 
             for product in products:
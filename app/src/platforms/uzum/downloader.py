@@ -24,6 +24,20 @@ from src.core.config import settings, RAW_STORAGE_DIR
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Photo sizes in order of preference (highest resolution first)
+_PHOTO_SIZES = ("800", "720", "540", "480", "240")
+
+
+def _iter_photo_urls(raw_photos):
+    """Yield the highest-resolution URL available for each photo."""
+    for photo in raw_photos:
+        photo_data = photo.get("photo") or {}
+        for size in _PHOTO_SIZES:
+            variant = photo_data.get(size)
+            if variant and variant.get("high"):
+                yield variant["high"]
+                break
+
 
 @dataclass
 class DownloadStats:
@@ -112,7 +126,7 @@ class UzumDownloader:
                     break
                 
                 # Create batch
-                batch_ids = list(range(current_id, min(current_id + self.batch_size, end_id)))
+                batch_ids = range(current_id, min(current_id + self.batch_size, end_id))
                 
                 # Download batch
                 products = await self.client.fetch_batch(batch_ids)
@@ -157,18 +171,11 @@ class UzumDownloader:
             if not parsed:
                 return
             
+            # Resolve the product payload once for photos and raw_data below
+            product_data = raw_data.get("payload", {}).get("data", {})
+
             # Extract all photo URLs
-            photos = []
-            raw_photos = raw_data.get("payload", {}).get("data", {}).get("photos", [])
-            for photo in raw_photos:
-                photo_data = photo.get("photo", {})
-                # Get highest resolution
-                for size in ["800", "720", "540", "480", "240"]:
-                    if size in photo_data:
-                        high = photo_data[size].get("high")
-                        if high:
-                            photos.append(high)
-                            break
+            photos = list(_iter_photo_urls(product_data.get("photos", ())))
             
             # Product data (deduplicated by ID)
             self._products_buffer[parsed.id] = {
@@ -196,7 +203,7 @@ class UzumDownloader:
                 "is_perishable": parsed.is_perishable,
                 "has_warranty": parsed.has_warranty,
                 "warranty_info": parsed.warranty_info,
-                "raw_data": raw_data.get("payload", {}).get("data", {}),
+                "raw_data": product_data,
             }
             
             # Seller data (deduplicated by ID)
@@ -206,7 +213,6 @@ class UzumDownloader:
                 if reg_date and isinstance(reg_date, (int, float)):
                     # Convert Unix timestamp (milliseconds) to datetime
                     # Use naive datetime (without timezone) for PostgreSQL TIMESTAMP WITHOUT TIME ZONE
-                    from datetime import datetime
                     reg_date = datetime.utcfromtimestamp(reg_date / 1000)
 
                 self._sellers_buffer[parsed.seller_id] = {
@@ -1,15 +1,17 @@
 """
 Uzum Parser - Parse raw API responses into structured data.
 """
-import re
 import logging
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timezone
 
-from ..base import ProductData
+from ..base import ProductData, normalize_title_text
 
 logger = logging.getLogger(__name__)
 
+# Shared read-only default for missing nested objects (never mutated)
+_EMPTY: Dict[str, Any] = {}
+
 
 class UzumParser:
     """
@@ -34,27 +36,29 @@ class UzumParser:
             ProductData or None if invalid
         """
         try:
-            payload = raw_data.get("payload", {})
-            data = payload.get("data", {})
+            payload = raw_data.get("payload") or _EMPTY
+            data = payload.get("data") or _EMPTY
             
             if not data or not data.get("title"):
                 return None
             
             # Parse category hierarchy
             category_path = []
-            cat = data.get("category", {})
+            cat = data.get("category") or _EMPTY
             category_id = cat.get("id") if cat else None
             category_title = cat.get("title") if cat else None
             
+            # Walk leaf -> root, then flip once (insert(0) is O(n) per level)
             while cat:
-                category_path.insert(0, {
+                category_path.append({
                     "id": cat.get("id"),
                     "title": cat.get("title"),
                 })
                 cat = cat.get("parent")
+            category_path.reverse()
             
             # Parse seller
-            seller = data.get("seller", {})
+            seller = data.get("seller") or _EMPTY
             seller_data = None
             if seller:
                 seller_data = {
@@ -70,11 +74,14 @@ class UzumParser:
                     "account_id": seller.get("sellerAccountId"),
                 }
             
-            # Parse SKUs
+            # Parse SKUs, summing availability in the same pass
             skus = []
-            for sku in data.get("skuList", []):
+            total_available = 0
+            for sku in data.get("skuList") or ():
                 full_price = sku.get("fullPrice")
                 purchase_price = sku.get("purchasePrice")
+                available_amount = sku.get("availableAmount", 0)
+                total_available += available_amount or 0
                 
                 # Calculate discount
                 discount = 0
@@ -86,27 +93,24 @@ class UzumParser:
                     "full_price": full_price,
                     "purchase_price": purchase_price,
                     "discount_percent": discount,
-                    "available_amount": sku.get("availableAmount", 0),
+                    "available_amount": available_amount,
                     "barcode": sku.get("barcode"),
                     "characteristics": sku.get("characteristics"),
                 })
             
             # Parse photos
             photos = []
-            for photo in data.get("photos", []):
+            for photo in data.get("photos") or ():
                 if isinstance(photo, dict) and photo.get("photoKey"):
                     photos.append(photo["photoKey"])
                 elif isinstance(photo, str):
                     photos.append(photo)
             
             # Parse localized titles
-            loc_title = data.get("localizableTitle", {})
+            loc_title = data.get("localizableTitle") or _EMPTY
             title_ru = loc_title.get("ru") if isinstance(loc_title, dict) else None
             title_uz = loc_title.get("uz") if isinstance(loc_title, dict) else None
 
-            # Calculate total availability
-            total_available = sum(sku.get("available_amount", 0) for sku in skus)
-
             # Extract video URL
             video = data.get("video")
             video_url = None
@@ -179,10 +183,7 @@ class UzumParser:
         """Normalize title for cross-seller matching."""
         if not title:
             return ""
-        # Remove special chars, lowercase, collapse whitespace
-        normalized = re.sub(r'[^\w\s]', '', title.lower())
-        normalized = re.sub(r'\s+', ' ', normalized).strip()
-        return normalized[:500]  # Limit length
+        return normalize_title_text(title)[:500]  # Limit length
 
 
 # Singleton
@@ -2,12 +2,12 @@
 Process Tasks - Celery tasks for processing raw data.
 """
 import asyncio
-import json
 import logging
 from pathlib import Path
 from datetime import datetime, timezone
 
 from celery import shared_task
+import orjson
 from sqlalchemy import select, update
 
 logger = logging.getLogger(__name__)
@@ -249,8 +249,7 @@ def process_raw_files(platform: str, directory: str = None) -> dict:
                 
                 for i, json_file in enumerate(json_files):
                     try:
-                        with open(json_file) as f:
-                            file_data = json.load(f)
+                        file_data = orjson.loads(json_file.read_bytes())
                         
                         # Extract lot data from nested structure
                         raw_lot_data = file_data.get('lot', file_data)
@@ -326,8 +325,7 @@ def process_raw_files(platform: str, directory: str = None) -> dict:
                 
                 for i, json_file in enumerate(json_files):
                     try:
-                        with open(json_file) as f:
-                            raw_data = json.load(f)
+                        raw_data = orjson.loads(json_file.read_bytes())
                         
                         parsed = parser.parse_product(raw_data)
                         if not parsed: